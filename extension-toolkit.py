@@ -1,18 +1,42 @@
 """Aseprite Extension Toolkit main script"""
 
+import functools
 import json
+import os
 import shutil
 import sys
+import threading
 import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 
 import click
+from click.core import ParameterSource
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
 try:
     DEFAULT_EXTENSIONS_FOLDER: Path = {
         "linux": Path("~/.config/Aseprite/extensions"),
@@ -23,6 +47,38 @@ except KeyError:
     click.echo(f"❌ Unsupported platform: {sys.platform}")
     sys.exit(1)
 
+# zlib's own default; level 9 costs much more CPU for a negligible size gain
+DEFAULT_COMPRESS_LEVEL = 6
+
+# Below this many files a thread pool costs more than it saves
+PARALLEL_ZIP_MIN_FILES = 4
+
+# Same idea for copying files into the Aseprite extensions folder
+PARALLEL_COPY_MIN_FILES = 4
+
+# Files smaller than this are stored as-is; deflate rarely shrinks them
+STORE_MAX_SIZE = 512
+
+# `pack` options that only affect building the package
+PACKAGE_ONLY_OPTIONS = {
+    "clean": "--clean",
+    "output": "--output",
+    "output_dir": "--output-dir",
+    "compress_level": "--compress-level",
+    "verbose": "--verbose",
+}
+
+# Characters not allowed in extension names (they end up in file paths)
+INVALID_NAME_CHARS = '<>:"/\\|?*'
+_STRIP_INVALID_NAME_CHARS = str.maketrans("", "", INVALID_NAME_CHARS)
+
+
+@functools.lru_cache(maxsize=None)
+def _header_borders(width: int) -> Tuple[str, str]:
+    """Build the top and bottom header borders for a given width"""
+    horizontal_line = "─" * (width - 2)
+    return f"╭{horizontal_line}╮", f"╰{horizontal_line}╯"
+
 
 def print_header(title: str, width: int = 60) -> None:
     """Print a beautiful header with the given title"""
@@ -36,16 +92,17 @@ def print_header(title: str, width: int = 60) -> None:
     left_padding = total_padding // 2
     right_padding = total_padding - left_padding - 1
 
-    horizontal_line = "─" * (actual_width - 2)
-    top_line = f"╭{horizontal_line}╮"
+    top_line, bottom_line = _header_borders(actual_width)
     middle_line = f"│{' ' * left_padding}{title}{' ' * right_padding}│"
-    bottom_line = f"╰{horizontal_line}╯"
 
-    click.echo()
-    click.echo(top_line)
-    click.echo(middle_line)
-    click.echo(bottom_line)
-    click.echo()
+    click.echo(f"\n{top_line}\n{middle_line}\n{bottom_line}\n")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_package_json(path: str, mtime_ns: int) -> Any:
+    """Parse package.json, cached until the file's mtime changes"""
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
 
 
 class ExtensionError(Exception):
@@ -66,7 +123,7 @@ class FileOperationError(ExtensionError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtensionConfig:
     """Configuration for an Aseprite extension"""
 
@@ -83,25 +140,42 @@ class ExtensionConfig:
     categories: Optional[List[str]] = None
     api_version: str = "1.3"
 
+    # Derived paths, built once in __post_init__
+    _package_json: Path = field(init=False, repr=False, compare=False)
+    _extension_keys: Path = field(init=False, repr=False, compare=False)
+    _extension_json: Path = field(init=False, repr=False, compare=False)
+    _main_script_path: Path = field(init=False, repr=False, compare=False)
+    _output_dir: Path = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.categories is None:
             self.categories = ["Scripts"]
 
+        self._package_json = self.path / "package.json"
+        self._extension_keys = self.path / "extension-keys.aseprite-keys"
+        self._extension_json = self.path / "extension.json"
+        self._main_script_path = self.path / self.main_script
+        self._output_dir = self.path / "dist"
+
     @property
     def package_json(self) -> Path:
-        return self.path / "package.json"
+        return self._package_json
 
     @property
     def extension_keys(self) -> Path:
-        return self.path / "extension-keys.aseprite-keys"
+        return self._extension_keys
 
     @property
     def extension_json(self) -> Path:
-        return self.path / "extension.json"
+        return self._extension_json
 
     @property
     def main_script_path(self) -> Path:
-        return self.path / self.main_script
+        return self._main_script_path
+
+    @property
+    def output_dir(self) -> Path:
+        return self._output_dir
 
     @classmethod
     def from_path(cls, extension_path: Path) -> "ExtensionConfig":
@@ -118,12 +192,15 @@ class ExtensionConfig:
 
         package_json_path = extension_path / "package.json"
 
-        if not package_json_path.exists():
+        try:
+            mtime_ns = package_json_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise ValidationError(f"package.json not found at {package_json_path}")
+        except OSError as e:
+            raise ValidationError(f"Failed to read package.json: {e}")
 
         try:
-            with open(package_json_path, "r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
+            data = _load_package_json(str(package_json_path), mtime_ns)
         except (json.JSONDecodeError, OSError) as e:
             raise ValidationError(f"Failed to read package.json: {e}")
 
@@ -134,10 +211,9 @@ class ExtensionConfig:
         if not name:
             raise ValidationError("Extension name is required in package.json")
 
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in name for char in invalid_chars):
+        if len(name.translate(_STRIP_INVALID_NAME_CHARS)) != len(name):
             raise ValidationError(
-                f"Extension name contains invalid characters: {invalid_chars}"
+                f"Extension name contains invalid characters: {INVALID_NAME_CHARS}"
             )
 
         main_script = "extension.lua"
@@ -162,6 +238,11 @@ class ExtensionConfig:
             author = ""
             website = ""
 
+        # Copy lists so configs never share state with the cached dict
+        categories = data.get("categories", ["Scripts"])
+        if isinstance(categories, list):
+            categories = list(categories)
+
         return cls(
             name=name,
             version=data.get("version", "1.0.0").strip() or "1.0.0",
@@ -173,7 +254,7 @@ class ExtensionConfig:
             website=website.strip(),
             source=website.strip(),
             license=data.get("license", "").strip(),
-            categories=data.get("categories", ["Scripts"]),
+            categories=categories,
             api_version="1.3",
         )
 
@@ -197,11 +278,26 @@ class ExtensionConfig:
 class ExtensionPacker:
     """Handles building and packaging Aseprite extensions"""
 
+    __slots__ = (
+        "config",
+        "extensions_folder",
+        "_base_str",
+        "_base_prefix",
+        "_base_prefix_len",
+        "_copied",
+    )
+
     def __init__(
         self, config: ExtensionConfig, extensions_folder: Optional[Path] = None
     ):
         self.config = config
         self.extensions_folder = extensions_folder or DEFAULT_EXTENSIONS_FOLDER
+        # String form of the extension root for cheap prefix checks
+        self._base_str = str(config.path)
+        self._base_prefix = os.path.join(self._base_str, "")
+        self._base_prefix_len = len(self._base_prefix)
+        # (st_mtime_ns, st_size) of each source file at its last install copy
+        self._copied: Dict[str, Tuple[int, int]] = {}
         self._validate_config()
 
     def _validate_config(self) -> None:
@@ -219,33 +315,60 @@ class ExtensionPacker:
             click.echo(f"⚠️  Extension directory not found: {self.config.path}")
             return []
 
-        try:
-            scripts = list(self.config.path.rglob("*.lua"))
-            if not scripts:
-                click.echo("⚠️  No .lua scripts found in extension directory")
-            return scripts
-        except OSError as e:
-            click.echo(f"⚠️  Error reading extension directory: {e}")
-            return []
+        # Walk with os.scandir so Path objects are only built for matches
+        scripts = []
+        pending = [self._base_str]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".lua") and entry.is_file():
+                            scripts.append(Path(entry.path))
+            except OSError as e:
+                click.echo(f"⚠️  Error reading extension directory: {e}")
 
-    def get_files_to_package(self, scripts: List[Path]) -> Set[Path]:
-        """Get all files that should be included in the package"""
-        files = {self.config.main_script_path, self.config.package_json, *scripts}
+        if not scripts:
+            click.echo("⚠️  No .lua scripts found in extension directory")
 
-        if self.config.extension_keys.exists():
-            files.add(self.config.extension_keys)
+        # scandir order depends on the filesystem; sort for reproducible output
+        scripts.sort(key=str)
+        return scripts
 
-        existing_files = set()
-        for file_path in files:
-            if file_path.exists():
-                existing_files.add(file_path)
-            else:
+    def get_files_to_package(self, scripts: List[Path]) -> List[Path]:
+        """Get all files that should be included in the package"""
+        main_script_path = self.config.main_script_path
+        package_json = self.config.package_json
+        extension_keys = self.config.extension_keys
+
+        candidates = [main_script_path, package_json, *scripts]
+        if os.path.exists(extension_keys):
+            candidates.append(extension_keys)
+
+        # Dedupe on the string form: cheaper to hash than Path, keeps order.
+        # normcase keeps Path's case-insensitive equality on Windows.
+        existing_files: Dict[str, Path] = {}
+        for file_path in candidates:
+            path_str = str(file_path)
+            key = os.path.normcase(path_str)
+            if key in existing_files:
+                continue
+            try:
+                os.stat(path_str)
+            except OSError:
                 click.echo(f"⚠️  File not found: {file_path}")
+                continue
+            existing_files[key] = file_path
 
-        return existing_files
+        return list(existing_files.values())
 
     def create_package(
-        self, output_dir: Optional[Path] = None, custom_name: Optional[str] = None
+        self,
+        output_dir: Optional[Path] = None,
+        custom_name: Optional[str] = None,
+        compresslevel: int = DEFAULT_COMPRESS_LEVEL,
+        verbose: bool = False,
     ) -> str:
         """Create .aseprite-extension package"""
         scripts = self.collect_scripts()
@@ -259,39 +382,30 @@ class ExtensionPacker:
         package_name = custom_name or self.config.name
         output_filename = f"{package_name}-{self.config.version}.aseprite-extension"
 
-        if output_dir:
-            if not output_dir.exists():
-                try:
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                except OSError as e:
-                    raise FileOperationError(f"Cannot create output directory: {e}")
-            output_path = output_dir / output_filename
-        else:
-            output_path = self.config.path / output_filename
+        output_path = (output_dir or self.config.output_dir) / output_filename
 
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            test_file = output_path.parent / ".write_test"
-            test_file.touch()
-            test_file.unlink()
         except OSError as e:
-            raise FileOperationError(f"Cannot write to output location: {e}")
+            raise FileOperationError(f"Cannot create output directory: {e}")
 
         print_header("🔧 Aseprite Extension Packaging Tool")
         click.echo(f"📦 Creating: {package_name} v{self.config.version}")
         click.echo(f"📁 Source: {self.config.path}")
         click.echo(f"📂 Packaging {len(files_to_include)} files...")
 
-        temp_extension_json = self.config.path / "extension.json"
+        temp_extension_json = self.config.extension_json
         extension_json_data = self.config.generate_extension_json()
 
         try:
-            with open(temp_extension_json, "w", encoding="utf-8") as f:
-                json.dump(extension_json_data, f, ensure_ascii=False, indent=2)
+            with open(temp_extension_json, "wb") as f:
+                f.write(_json_dumps(extension_json_data))
 
-            files_to_include.add(temp_extension_json)
+            files_to_include.append(temp_extension_json)
 
-            self._create_zip_package(files_to_include, output_path)
+            self._create_zip_package(
+                files_to_include, output_path, compresslevel, verbose
+            )
             self._show_package_info(output_path)
 
         finally:
@@ -303,20 +417,41 @@ class ExtensionPacker:
 
         return str(output_path)
 
-    def _create_zip_package(self, files: Set[Path], output_path: Path) -> None:
+    def _create_zip_package(
+        self,
+        files: List[Path],
+        output_path: Path,
+        compresslevel: int = DEFAULT_COMPRESS_LEVEL,
+        verbose: bool = False,
+    ) -> None:
         """Create ZIP package with all files"""
+        written: List[str] = []
         try:
-            with zipfile.ZipFile(
-                output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=9
-            ) as zipf:
-                for file_path in files:
-                    try:
-                        arcname = self._get_archive_name(file_path)
-                        zipf.write(file_path, arcname)
-                        click.echo(f"  📄 {file_path.name} -> {arcname}")
-                    except OSError as e:
-                        click.echo(f"  ⚠️  Skipping {file_path.name}: {e}")
-                        continue
+            zipf = zipfile.ZipFile(
+                output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+            )
+        except OSError as e:
+            raise FileOperationError(f"Cannot write to output location: {e}")
+
+        try:
+            with zipf:
+                if len(files) < PARALLEL_ZIP_MIN_FILES:
+                    for file_path in files:
+                        try:
+                            arcname = self._get_archive_name(file_path)
+                            zipf.write(
+                                file_path,
+                                arcname,
+                                compress_type=self._compress_type_for(
+                                    file_path.stat().st_size
+                                ),
+                            )
+                            written.append(f"  📄 {file_path.name} -> {arcname}")
+                        except OSError as e:
+                            click.echo(f"  ⚠️  Skipping {file_path.name}: {e}")
+                            continue
+                else:
+                    self._write_files_parallel(zipf, files, compresslevel, written)
         except Exception as e:
             if output_path.exists():
                 try:
@@ -325,11 +460,103 @@ class ExtensionPacker:
                     pass
             raise FileOperationError(f"Failed to create package: {e}")
 
+        # Report once at the end instead of writing to the terminal per file
+        if verbose and written:
+            click.echo("\n".join(written))
+
+    def _write_files_parallel(
+        self,
+        zipf: zipfile.ZipFile,
+        files: List[Path],
+        compresslevel: int,
+        written: List[str],
+    ) -> None:
+        """Compress files on a thread pool and append them to the archive in order"""
+        workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            jobs = [
+                (
+                    file_path,
+                    pool.submit(
+                        self._compress_file,
+                        file_path,
+                        self._get_archive_name(file_path),
+                        compresslevel,
+                    ),
+                )
+                for file_path in files
+            ]
+
+            for file_path, job in jobs:
+                try:
+                    zinfo, data = job.result()
+                except OSError as e:
+                    click.echo(f"  ⚠️  Skipping {file_path.name}: {e}")
+                    continue
+                self._write_precompressed(zipf, zinfo, data)
+                written.append(f"  📄 {file_path.name} -> {zinfo.filename}")
+
+    @staticmethod
+    def _compress_type_for(size: int) -> int:
+        """Pick the ZIP compression method for a file of the given size"""
+        return zipfile.ZIP_STORED if size < STORE_MAX_SIZE else zipfile.ZIP_DEFLATED
+
+    @classmethod
+    def _compress_file(
+        cls, file_path: Path, arcname: str, compresslevel: int
+    ) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Read and compress a file, returning its ZipInfo and archive data"""
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        data = file_path.read_bytes()
+
+        zinfo.compress_type = cls._compress_type_for(len(data))
+        if zinfo.compress_type == zipfile.ZIP_STORED:
+            compressed = data
+        else:
+            # zlib releases the GIL while compressing, so threads run in parallel
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+            compressed = compressor.compress(data) + compressor.flush()
+
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data)
+        return zinfo, compressed
+
+    @staticmethod
+    def _write_precompressed(
+        zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes
+    ) -> None:
+        """Append an already compressed entry to an archive opened for writing
+
+        zipfile has no public API for raw entries, so this mirrors what
+        ZipFile.mkdir does for its header-only entries.
+        """
+        with zipf._lock:
+            if zipf._seekable:
+                zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.fp.write(zinfo.FileHeader(None))
+            zipf.fp.write(data)
+            zipf.start_dir = zipf.fp.tell()
+
+    def _relative_name(self, file_path: Path) -> Optional[str]:
+        """Get the POSIX path of a file relative to the extension root, if inside it"""
+        path_str = str(file_path)
+        if path_str.startswith(self._base_prefix):
+            return path_str[self._base_prefix_len :].replace(os.sep, "/")
+        return None
+
     def _get_archive_name(self, file_path: Path) -> str:
         """Get the archive name for a file preserving structure"""
-        if file_path.is_relative_to(self.config.path):
-            return str(file_path.relative_to(self.config.path).as_posix())
-        return file_path.name
+        relative_name = self._relative_name(file_path)
+        if relative_name is None:
+            return file_path.name
+        return relative_name
 
     def _show_package_info(self, output_path: Path) -> None:
         """Display package information"""
@@ -354,7 +581,11 @@ class ExtensionPacker:
             return f"{size / (1024 * 1024):.1f} MB"
 
     def install_to_aseprite(self) -> bool:
-        """Install extension directly to Aseprite extensions folder"""
+        """Install extension directly to Aseprite extensions folder
+
+        Source files are copied as-is; this never builds a package archive,
+        so it stays cheap enough to run on every live reload event.
+        """
         try:
             if not self.extensions_folder.exists():
                 try:
@@ -363,18 +594,13 @@ class ExtensionPacker:
                     click.echo(f"❌ Cannot create extensions folder: {e}")
                     return False
 
-            try:
-                test_file = self.extensions_folder / ".write_test"
-                test_file.touch()
-                test_file.unlink()
-            except OSError as e:
-                click.echo(f"❌ No write access to extensions folder: {e}")
-                return False
-
             scripts = self.collect_scripts()
             extension_folder = self.extensions_folder / self.config.name
 
-            if extension_folder.exists():
+            # Start from a clean folder on the first install only; later
+            # installs just update what changed since the previous one
+            fresh_install = not self._copied
+            if fresh_install and extension_folder.exists():
                 try:
                     shutil.rmtree(extension_folder)
                 except OSError as e:
@@ -387,7 +613,8 @@ class ExtensionPacker:
                 click.echo(f"❌ Cannot create extension folder: {e}")
                 return False
 
-            click.echo(f"✅ Created extension folder: {extension_folder}")
+            if fresh_install:
+                click.echo(f"✅ Created extension folder: {extension_folder}")
 
             files_to_copy = [
                 *scripts,
@@ -409,39 +636,109 @@ class ExtensionPacker:
             return False
 
     def _copy_files_to_folder(self, files: List[Path], target_folder: Path) -> bool:
-        """Copy files to target folder preserving structure"""
+        """Copy files to target folder preserving structure
+
+        Files whose mtime and size match the previous copy are skipped, and
+        files copied before but no longer present are removed.
+        """
         success = True
+        present = set()
+        pending: List[Tuple[Path, Tuple[int, int], Path]] = []
 
         for file_path in files:
-            if not file_path.exists():
+            source = str(file_path)
+            try:
+                stat = os.stat(source)
+            except OSError:
                 continue
 
-            try:
-                if file_path.is_relative_to(self.config.path):
-                    relative_path = file_path.relative_to(self.config.path)
-                    target_path = target_folder / relative_path
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                else:
-                    target_path = target_folder / file_path.name
+            present.add(source)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            target_path = self._target_path(file_path, target_folder)
+
+            if self._copied.get(source) == signature and target_path.exists():
+                continue
+            pending.append((file_path, signature, target_path))
 
-                shutil.copy2(file_path, target_path)
+        # Copies are I/O bound, so threads overlap them despite the GIL
+        if len(pending) < PARALLEL_COPY_MIN_FILES:
+            errors = list(map(self._copy_one, pending))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+                errors = list(pool.map(self._copy_one, pending))
+
+        for (file_path, signature, _), error in zip(pending, errors):
+            if error is None:
+                self._copied[str(file_path)] = signature
                 click.echo(f"✅ Copied: {file_path.name}")
+            else:
+                self._copied.pop(str(file_path), None)
+                click.echo(f"⚠️  Failed to copy {file_path.name}: {error}")
+                success = False
 
+        for source in self._copied.keys() - present:
+            del self._copied[source]
+            file_path = Path(source)
+            try:
+                self._target_path(file_path, target_folder).unlink(missing_ok=True)
+                click.echo(f"🗑️  Removed: {file_path.name}")
             except OSError as e:
-                click.echo(f"⚠️  Failed to copy {file_path.name}: {e}")
-                success = False
-                continue
+                click.echo(f"⚠️  Failed to remove {file_path.name}: {e}")
 
         return success
 
+    def _copy_one(self, job: Tuple[Path, Tuple[int, int], Path]) -> Optional[OSError]:
+        """Copy a single pending file, returning the error if it failed"""
+        file_path, _, target_path = job
+        try:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fast_copy(file_path, target_path)
+        except OSError as e:
+            return e
+        return None
+
+    def _target_path(self, file_path: Path, target_folder: Path) -> Path:
+        """Get the installed location of a source file"""
+        relative_name = self._relative_name(file_path)
+        if relative_name is None:
+            return target_folder / file_path.name
+        return target_folder / relative_name
+
+    @staticmethod
+    def _fast_copy(src: Path, dst: Path) -> None:
+        """Copy file contents only; Aseprite needs neither mode nor timestamps"""
+        if hasattr(os, "copy_file_range"):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                try:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    total = 0
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        total += copied
+                        remaining -= copied
+
+                    # Some filesystems report 0 before EOF; only trust an
+                    # early 0 as EOF once some data has actually been copied
+                    if remaining <= 0 or total > 0:
+                        return
+                except OSError:
+                    # Unsupported by this kernel or filesystem pair
+                    pass
+
+        shutil.copyfile(src, dst)
+
     def _generate_extension_json(self, target_folder: Path) -> None:
         """Generate extension.json dynamically"""
         extension_json = self.config.generate_extension_json()
         extension_json_path = target_folder / "extension.json"
 
         try:
-            with open(extension_json_path, "w", encoding="utf-8") as f:
-                json.dump(extension_json, f, ensure_ascii=False, indent=2)
+            with open(extension_json_path, "wb") as f:
+                f.write(_json_dumps(extension_json))
             click.echo("✅ extension.json created")
         except OSError as e:
             click.echo(f"⚠️  Failed to create extension.json: {e}")
@@ -451,11 +748,11 @@ class ExtensionPacker:
         installed_files = []
 
         for script in scripts:
-            if script.is_relative_to(self.config.path):
-                relative_path = script.relative_to(self.config.path)
-                installed_files.append(str(relative_path.as_posix()))
-            else:
+            relative_name = self._relative_name(script)
+            if relative_name is None:
                 installed_files.append(script.name)
+            else:
+                installed_files.append(relative_name)
 
         installed_files.extend(["extension.json", "package.json"])
 
@@ -466,16 +763,29 @@ class ExtensionPacker:
         info_path = target_folder / "__info.json"
 
         try:
-            with open(info_path, "w", encoding="utf-8") as f:
-                json.dump(info_data, f, ensure_ascii=False, indent=2)
+            with open(info_path, "wb") as f:
+                f.write(_json_dumps(info_data))
             click.echo("✅ __info.json created")
         except OSError as e:
             click.echo(f"⚠️  Failed to create __info.json: {e}")
 
-    def clean_previous_builds(self) -> None:
-        """Remove previous .aseprite-extension files"""
+    def clean_previous_builds(self, output_dir: Optional[Path] = None) -> None:
+        """Remove previous .aseprite-extension files
+
+        Packages used to be written to the extension root, so stale ones
+        left there by older versions are removed as well.
+        """
+        search_dirs = [(output_dir or self.config.output_dir).resolve()]
+        if self.config.path not in search_dirs:
+            search_dirs.append(self.config.path)
+
         try:
-            old_extensions = list(self.config.path.glob("*.aseprite-extension"))
+            old_extensions = [
+                ext_file
+                for search_dir in search_dirs
+                if search_dir.exists()
+                for ext_file in search_dir.glob("*.aseprite-extension")
+            ]
             if old_extensions:
                 click.echo("🧹 Cleaning previous builds...")
                 for ext_file in old_extensions:
@@ -494,35 +804,62 @@ class ExtensionWatcher(FileSystemEventHandler):
     def __init__(self, builder: ExtensionPacker, debounce_seconds: float = 1.0):
         super().__init__()
         self.builder = builder
-        self.last_build_time = 0.0
         self.debounce_seconds = debounce_seconds
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._stopped = False
 
     def on_modified(self, event: FileSystemEvent) -> None:
         try:
             if event.is_directory:
                 return
 
-            file_path = Path(event.src_path)
-            if not self._should_trigger_rebuild(file_path):
-                return
-
-            current_time = time.time()
-            if current_time - self.last_build_time < self.debounce_seconds:
+            # Filter on the raw string; this runs for every event, including
+            # editor temp files. Generated files (extension.json, packages)
+            # are left out so our own writes never trigger a rebuild.
+            src = event.src_path
+            changed_name = os.path.basename(src)
+            if not (src.endswith(".lua") or changed_name == "package.json"):
                 return
 
-            self.last_build_time = current_time
-            click.echo(f"\n📝 Detected change: {file_path.name}")
-            self.builder.install_to_aseprite()
+            # Restart the countdown on every event so a burst of changes
+            # results in a single rebuild once things settle down
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(
+                    self.debounce_seconds, self._rebuild, args=(changed_name,)
+                )
+                self._timer.daemon = True
+                self._timer.start()
 
         except Exception as e:
             click.echo(f"⚠️  Error handling file change: {e}")
 
-    def _should_trigger_rebuild(self, file_path: Path) -> bool:
-        """Check if file change should trigger a rebuild"""
-        return file_path.suffix == ".lua" or file_path.name in [
-            "extension.json",
-            "package.json",
-        ]
+    def cancel(self) -> None:
+        """Cancel a pending rebuild and wait for one already in progress"""
+        with self._lock:
+            self._stopped = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        # Rebuilds run on daemon threads; let a running install finish so
+        # exiting never leaves half-copied files in the extensions folder
+        with self._build_lock:
+            pass
+
+    def _rebuild(self, changed_name: str) -> None:
+        """Reinstall the extension after the debounce period"""
+        with self._build_lock:
+            if self._stopped:
+                return
+            try:
+                click.echo(f"\n📝 Detected change: {changed_name}")
+                self.builder.install_to_aseprite()
+            except Exception as e:
+                click.echo(f"⚠️  Error handling file change: {e}")
 
 
 class LiveReloadManager:
@@ -537,7 +874,7 @@ class LiveReloadManager:
         click.echo("🔄 Live reload mode started")
         click.echo(f"📁 Extension: {self.builder.config.path}")
         click.echo(f"   Debounce: {self.debounce}s")
-        click.echo("   Watching: .lua, extension.json, package.json")
+        click.echo("   Watching: .lua, package.json")
         click.echo("   Press Ctrl+C to exit\n")
 
         if not self.builder.install_to_aseprite():
@@ -565,6 +902,7 @@ class LiveReloadManager:
         finally:
             observer.stop()
             observer.join()
+            event_handler.cancel()
             click.echo("✅ Live reload stopped")
 
 
@@ -584,30 +922,58 @@ def cli() -> None:
 )
 @click.option("--clean", "-c", is_flag=True, help="Clean previous builds first")
 @click.option("--install", "-i", is_flag=True, help="Install to Aseprite after build")
+@click.option(
+    "--install-only",
+    is_flag=True,
+    help="Install to Aseprite without building a package",
+)
 @click.option("--output", "-o", help="Custom output name (without extension)")
 @click.option(
     "--output-dir",
     type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
-    help="Output directory (default: extension directory)",
+    help="Output directory (default: dist/ in the extension directory)",
+)
+@click.option(
+    "--compress-level",
+    type=click.IntRange(0, 9),
+    default=DEFAULT_COMPRESS_LEVEL,
+    help=f"ZIP compression level 0-9 (default: {DEFAULT_COMPRESS_LEVEL})",
 )
+@click.option("--verbose", "-v", is_flag=True, help="List every packaged file")
 def pack(
     extension_path: Path,
     clean: bool,
     install: bool,
+    install_only: bool,
     output: Optional[str],
     output_dir: Optional[Path],
+    compress_level: int,
+    verbose: bool,
 ) -> None:
     """Pack extension command"""
+    if install_only:
+        ctx = click.get_current_context()
+        conflicting = [
+            flag
+            for name, flag in PACKAGE_ONLY_OPTIONS.items()
+            if ctx.get_parameter_source(name) is not ParameterSource.DEFAULT
+        ]
+        if conflicting:
+            raise click.UsageError(
+                f"--install-only cannot be combined with {', '.join(conflicting)}"
+            )
+
     try:
         config = ExtensionConfig.from_path(extension_path)
         packer = ExtensionPacker(config)
 
         if clean:
-            packer.clean_previous_builds()
+            packer.clean_previous_builds(output_dir)
 
-        packer.create_package(output_dir, output)
+        if not install_only:
+            packer.create_package(output_dir, output, compress_level, verbose)
 
-        if install:
+        if install or install_only:
             if not packer.install_to_aseprite():
                 click.echo("❌ Installation failed")
                 sys.exit(1)